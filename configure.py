@@ -4,22 +4,42 @@
 import json
 import os
 import platform
+import sys
+from functools import cache
 from pathlib import Path
 
+# Detected once at import time; platform.system() can be surprisingly
+# expensive to call repeatedly on some platforms.
+_SYSTEM = platform.system()
 
-def get_config_path():
-    """Get the Claude Desktop config path for the current OS."""
-    system = platform.system()
 
-    if system == "Darwin":  # macOS
-        return Path.home() / "Library/Application Support/Claude/claude_desktop_config.json"
-    elif system == "Windows":
+@cache
+def get_config_path():
+    """Get the Claude Desktop config path (as a string) for the current OS.
+
+    Built with os.path rather than pathlib to avoid Path allocations;
+    callers that want a Path can wrap the result once.
+    """
+    if _SYSTEM not in ("Darwin", "Windows", "Linux"):
+        return None
+
+    if _SYSTEM == "Darwin":  # macOS
+        return os.path.join(
+            os.path.expanduser("~"),
+            "Library",
+            "Application Support",
+            "Claude",
+            "claude_desktop_config.json",
+        )
+    elif _SYSTEM == "Windows":
         appdata = os.getenv("APPDATA")
         if appdata:
-            return Path(appdata) / "Claude/claude_desktop_config.json"
-    elif system == "Linux":
+            return os.path.join(appdata, "Claude", "claude_desktop_config.json")
+    elif _SYSTEM == "Linux":
         # Linux doesn't have official Claude Desktop, but just in case
-        return Path.home() / ".config/Claude/claude_desktop_config.json"
+        return os.path.join(
+            os.path.expanduser("~"), ".config", "Claude", "claude_desktop_config.json"
+        )
 
     return None
 
@@ -61,15 +81,23 @@ def main():
     if api_key:
         config["mcpServers"]["netdata"]["env"]["NETDATA_API_KEY"] = api_key
 
-    # Display configuration
-    print("\n" + "=" * 70)
-    print("Generated Configuration:")
-    print("=" * 70)
-    print(json.dumps(config, indent=2))
-    print("=" * 70)
-
-    # Get Claude Desktop config path
+    # Serialize once; the display and both file writes reuse the same bytes
+    config_json = json.dumps(config, indent=2)
+    config_bytes = config_json.encode("utf-8")
+
+    # Display configuration (one buffered write instead of a print per line)
+    buf = [
+        "\n" + "=" * 70 + "\n",
+        "Generated Configuration:\n",
+        "=" * 70 + "\n",
+        config_json + "\n",
+        "=" * 70 + "\n",
+    ]
+    sys.stdout.write("".join(buf))
+
+    # Get Claude Desktop config path (string from the helper, Path here)
     config_path = get_config_path()
+    config_path = Path(config_path) if config_path else None
 
     if config_path:
         print(f"\n📍 Claude Desktop config location:")
@@ -90,27 +118,36 @@ def main():
 
             if create == "y":
                 config_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(config_path, "w") as f:
-                    json.dump(config, f, indent=2)
-                print(f"\n✅ Configuration saved to: {config_path}")
+                # O_CREAT|O_EXCL creates and checks in one syscall, so a file
+                # that appeared since the exists() check can't be clobbered
+                try:
+                    fd = os.open(config_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                except FileExistsError:
+                    print("\n⚠️  Config file appeared in the meantime — not overwriting it.")
+                    print("Please merge the 'netdata' entry into it manually.")
+                else:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(config_bytes)
+                    print(f"\n✅ Configuration saved to: {config_path}")
     else:
         print("\n⚠️  Could not determine Claude Desktop config path for your OS")
         print("Please manually add the configuration to your Claude Desktop config file")
 
     # Save to local file
     local_config = current_dir / "my_claude_config.json"
-    with open(local_config, "w") as f:
-        json.dump(config, f, indent=2)
-
-    print(f"\n💾 Configuration also saved to: {local_config}")
-
-    print("\n" + "=" * 70)
-    print("Next Steps:")
-    print("=" * 70)
-    print("1. Verify the configuration above is correct")
-    print("2. Restart Claude Desktop completely (quit, don't just close)")
-    print("3. Test by asking Claude: 'What's my current CPU usage?'")
-    print("\n✨ Setup complete!")
+    local_config.write_bytes(config_bytes)
+
+    buf = [
+        f"\n💾 Configuration also saved to: {local_config}\n",
+        "\n" + "=" * 70 + "\n",
+        "Next Steps:\n",
+        "=" * 70 + "\n",
+        "1. Verify the configuration above is correct\n",
+        "2. Restart Claude Desktop completely (quit, don't just close)\n",
+        "3. Test by asking Claude: 'What's my current CPU usage?'\n",
+        "\n✨ Setup complete!\n",
+    ]
+    sys.stdout.write("".join(buf))
 
 
 if __name__ == "__main__":
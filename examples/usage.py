@@ -10,9 +10,32 @@ async def main():
     client = NetdataClient()
 
     try:
+        # Fire all six independent queries concurrently; the client's shared
+        # connection pool multiplexes them over keep-alive sockets, so total
+        # wall time is bounded by the slowest call instead of the sum.
+        info, contexts, cpu_data, alerts, search_results, functions = await asyncio.gather(
+            client.get_info(),
+            client.get_contexts(api_version="v2"),
+            client.get_data(
+                context="system.cpu",
+                after=-600,
+                format="json",
+                options=["jsonwrap"],
+            ),
+            client.get_alerts(active=True),
+            client.search_contexts(query="disk", api_version="v2"),
+            client.get_functions(),
+            return_exceptions=True,
+        )
+
+        # Normalize failed calls to the client's error-dict shape
+        info, contexts, cpu_data, alerts, search_results, functions = (
+            {"error": str(r)} if isinstance(r, BaseException) else r
+            for r in (info, contexts, cpu_data, alerts, search_results, functions)
+        )
+
         # Get basic info
         print("=== Netdata Agent Info ===")
-        info = await client.get_info()
         print(f"Version: {info.get('version')}")
         print(f"Hostname: {info.get('hostname')}")
         print(f"OS: {info.get('os_name')}")
@@ -20,7 +43,6 @@ async def main():
 
         # List available contexts
         print("=== Available Contexts (first 5) ===")
-        contexts = await client.get_contexts(api_version="v2")
         context_list = list(contexts.get("contexts", {}).keys())[:5]
         for ctx in context_list:
             print(f"  - {ctx}")
@@ -28,12 +50,6 @@ async def main():
 
         # Get CPU data
         print("=== CPU Data (last 10 minutes) ===")
-        cpu_data = await client.get_data(
-            context="system.cpu",
-            after=-600,
-            format="json",
-            options=["jsonwrap"],
-        )
         if "result" in cpu_data:
             print(f"Points returned: {cpu_data.get('points')}")
             print(f"Time range: {cpu_data.get('after')} to {cpu_data.get('before')}")
@@ -42,7 +58,6 @@ async def main():
 
         # Check active alerts
         print("=== Active Alerts ===")
-        alerts = await client.get_alerts(active=True)
         if "alarms" in alerts:
             alarm_count = len(alerts["alarms"])
             print(f"Total active alarms: {alarm_count}")
@@ -55,7 +70,6 @@ async def main():
 
         # Search for disk-related contexts
         print("=== Searching for 'disk' contexts ===")
-        search_results = await client.search_contexts(query="disk", api_version="v2")
         if "contexts" in search_results:
             for ctx in list(search_results["contexts"].keys())[:5]:
                 print(f"  - {ctx}")
@@ -63,7 +77,6 @@ async def main():
 
         # List available functions
         print("=== Available Functions ===")
-        functions = await client.get_functions()
         if isinstance(functions, dict):
             for func_name in list(functions.keys())[:5]:
                 print(f"  - {func_name}")
@@ -2,6 +2,16 @@
 
 __version__ = "0.1.0"
 
-from .server import NetdataClient, app
-
 __all__ = ["NetdataClient", "app"]
+
+
+def __getattr__(name):
+    # Lazy re-export (PEP 562): importing netdata_mcp stays cheap, and the
+    # heavy server module (httpx, mcp, pydantic) only loads on first access.
+    if name in __all__:
+        from . import server
+
+        val = getattr(server, name)
+        globals()[name] = val
+        return val
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,11 @@
 """Netdata MCP Server - Integrates Netdata API with Claude via MCP protocol."""
 
 import asyncio
-import json
+import time
 from typing import Any, Optional
-from urllib.parse import urljoin, urlencode
 
 import httpx
+import orjson
 from mcp.server import Server
 from mcp.types import (
     Tool,
@@ -29,24 +29,137 @@ class NetdataClient:
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Long-lived server, many small calls to one host: keep a warm
+        # keep-alive pool and multiplex over HTTP/2 instead of paying a
+        # TCP/TLS handshake per request. keepalive_expiry bounds how long
+        # idle connections (and any stale routing) survive.
+        limits = httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=30.0,
+        )
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            limits=limits,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Auth is fixed for the client's lifetime; setting it as a
+            # default header avoids a dict build + f-string per request
+            headers={"Authorization": f"Bearer {api_key}"} if api_key else None,
+        )
+        # TTL cache for slow-changing metadata endpoints:
+        # (api_version, endpoint, params) -> (expiry, result)
+        self._cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+        # Single-flight map: concurrent duplicate requests await one task
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Cap concurrent upstream requests; a single Netdata agent isn't
+        # built for unbounded fan-out, and 20 matches the keep-alive pool
+        self._sem = asyncio.Semaphore(20)
 
     async def _request(
-        self, endpoint: str, params: Optional[dict] = None, api_version: str = "v1"
-    ) -> dict[str, Any]:
-        """Make a request to Netdata API."""
-        url = urljoin(self.base_url, f"/api/{api_version}/{endpoint}")
+        self,
+        endpoint: str = "",
+        params: Optional[dict | list[tuple[str, Any]]] = None,
+        api_version: str = "v1",
+        raw: bool = False,
+        path: Optional[str] = None,
+    ) -> Any:
+        """Make a request to Netdata API, coalescing duplicate in-flight calls.
 
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        When several tool calls ask for the same (endpoint, params) at the
+        same time, only one upstream request is issued; the rest await it.
 
+        Args:
+            endpoint: API endpoint under /api/{api_version}/
+            params: Query parameters
+            api_version: API version to use (v1, v2, or v3)
+            raw: Return the response body bytes instead of parsed JSON
+            path: Full request path, overriding endpoint/api_version
+        """
+        if not params:
+            key_params = ()
+        elif isinstance(params, dict):
+            key_params = tuple(sorted(params.items()))
+        else:
+            key_params = tuple(params)
+        key = (api_version, endpoint, path, raw, key_params)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        task = asyncio.create_task(self._fetch(endpoint, params, api_version, raw, path))
+        self._inflight[key] = task
         try:
-            response = await self.client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+            return await task
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: Optional[dict | list[tuple[str, Any]]],
+        api_version: str,
+        raw: bool = False,
+        path: Optional[str] = None,
+    ) -> Any:
+        """Issue a single GET against the Netdata API."""
+        # Relative path; the client's base_url avoids re-parsing URLs per call
+        url = path if path is not None else f"/api/{api_version}/{endpoint}"
+
+        try:
+            # Stream the body instead of letting httpx materialize it up
+            # front; large data/allmetrics payloads arrive chunk by chunk
+            async with self._sem:
+                async with self.client.stream("GET", url, params=params) as response:
+                    if response.status_code >= 400:
+                        # Error bodies are often HTML, not JSON; surface a
+                        # short snippet instead of raising and re-catching
+                        head = b""
+                        async for chunk in response.aiter_bytes():
+                            head += chunk
+                            if len(head) >= 256:
+                                break
+                        if raw:
+                            return head[:256]
+                        return {
+                            "error": head[:256].decode("utf-8", "replace"),
+                            "status_code": response.status_code,
+                        }
+                    chunks = [chunk async for chunk in response.aiter_bytes()]
+            body = b"".join(chunks)
+            if raw:
+                return body
+            # orjson parses the raw bytes directly, skipping httpx's
+            # text decode + stdlib json pass
+            return orjson.loads(body)
         except httpx.HTTPError as e:
-            return {"error": str(e), "status_code": getattr(e.response, "status_code", None)}
+            # Transport-level failure (connect, timeout, protocol error)
+            if raw:
+                return str(e).encode()
+            return {"error": str(e), "status_code": None}
+
+    async def _cached_request(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        api_version: str = "v1",
+        ttl: float = 30.0,
+    ) -> dict[str, Any]:
+        """Like _request, but serves repeat calls from a TTL cache.
+
+        Only used for idempotent metadata endpoints whose answers change
+        slowly; live queries (data, alarms) always go to the agent.
+        """
+        key = (api_version, endpoint, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        result = await self._request(endpoint, params=params, api_version=api_version)
+        if "error" not in result:
+            self._cache[key] = (now + ttl, result)
+        return result
 
     async def close(self):
         """Close the HTTP client."""
@@ -55,11 +168,11 @@ class NetdataClient:
     # Info & Nodes
     async def get_info(self) -> dict[str, Any]:
         """Get basic information about the Netdata agent."""
-        return await self._request("info")
+        return await self._cached_request("info", ttl=30.0)
 
     async def get_nodes(self, api_version: str = "v2") -> dict[str, Any]:
         """Get list of all nodes hosted by this Netdata Agent."""
-        return await self._request("nodes", api_version=api_version)
+        return await self._cached_request("nodes", api_version=api_version, ttl=30.0)
 
     # Contexts
     async def get_contexts(
@@ -67,7 +180,9 @@ class NetdataClient:
     ) -> dict[str, Any]:
         """Get list of all contexts across all nodes."""
         params = {"scope_nodes": scope_nodes, "scope_contexts": scope_contexts}
-        return await self._request("contexts", params=params, api_version=api_version)
+        return await self._cached_request(
+            "contexts", params=params, api_version=api_version, ttl=15.0
+        )
 
     async def search_contexts(
         self, query: str, api_version: str = "v2", scope_nodes: str = "*"
@@ -103,29 +218,66 @@ class NetdataClient:
             options: Additional options (jsonwrap, raw, minify, etc.)
             api_version: API version to use (v1, v2, or v3)
         """
-        params = {
-            "after": after,
-            "before": before,
-            "points": points,
-            "format": format,
-            "group": group,
-        }
+        # List of pairs instead of a dict: httpx accepts both, and appending
+        # to a list skips the per-key hashing on this hot query path
+        params = [
+            ("after", after),
+            ("before", before),
+            ("points", points),
+            ("format", format),
+            ("group", group),
+        ]
 
         if api_version == "v1":
             if chart:
-                params["chart"] = chart
+                params.append(("chart", chart))
             elif context:
-                params["context"] = context
+                params.append(("context", context))
         else:
             # v2/v3 use scope_contexts parameter
             if context:
-                params["scope_contexts"] = context
+                params.append(("scope_contexts", context))
 
         if options:
-            params["options"] = ",".join(options)
+            params.append(("options", ",".join(options)))
 
         return await self._request("data", params=params, api_version=api_version)
 
+    async def get_data_batch(
+        self,
+        contexts: list[str],
+        after: int = -600,
+        before: int = 0,
+        points: int = 0,
+        format: str = "json",
+        group: str = "average",
+        options: Optional[list[str]] = None,
+        api_version: str = "v2",
+    ) -> dict[str, Any]:
+        """
+        Query metric data for several contexts in one request (v2/v3 only).
+
+        Args:
+            contexts: Contexts to query, combined into one scope_contexts pattern
+            after: Start time (negative for seconds ago, positive for unix timestamp)
+            before: End time (negative for seconds ago, positive for unix timestamp, 0 for now)
+            points: Number of points to return (0 for all available)
+            format: Response format (json, jsonp, csv, etc.)
+            group: Time aggregation function (average, min, max, sum, etc.)
+            options: Additional options (jsonwrap, raw, minify, etc.)
+            api_version: API version to use (v2 or v3)
+        """
+        return await self.get_data(
+            context="|".join(contexts),
+            after=after,
+            before=before,
+            points=points,
+            format=format,
+            group=group,
+            options=options,
+            api_version=api_version,
+        )
+
     async def get_all_metrics(
         self,
         format: str = "json",
@@ -148,6 +300,20 @@ class NetdataClient:
 
         return await self._request("allmetrics", params=params)
 
+    async def get_all_metrics_batch(
+        self, filters: list[str], format: str = "json"
+    ) -> dict[str, Any]:
+        """
+        Get latest values for several chart filters in one request.
+
+        Args:
+            filters: Chart filter patterns, combined into one simple pattern
+            format: Response format (shell, prometheus, json)
+        """
+        # Netdata simple patterns accept pipe-separated alternatives, so N
+        # filters collapse into one round-trip instead of N
+        return await self.get_all_metrics(format=format, filter="|".join(filters))
+
     # Alerts
     async def get_alerts(self, all: bool = False, active: bool = False) -> dict[str, Any]:
         """
@@ -185,12 +351,12 @@ class NetdataClient:
         Args:
             chart: Chart ID
         """
-        return await self._request("alarm_variables", params={"chart": chart})
+        return await self._cached_request("alarm_variables", params={"chart": chart}, ttl=60.0)
 
     # Functions
     async def get_functions(self) -> dict[str, Any]:
         """Get list of all registered collector functions."""
-        return await self._request("functions")
+        return await self._cached_request("functions", ttl=60.0)
 
     async def execute_function(self, function: str, timeout: int = 10) -> dict[str, Any]:
         """
@@ -236,17 +402,8 @@ class NetdataClient:
         if value_color:
             params["value_color"] = value_color
 
-        url = urljoin(self.base_url, "/api/v1/badge.svg")
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-
-        try:
-            response = await self.client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.content
-        except httpx.HTTPError as e:
-            return str(e).encode()
+        # Same pooled/coalesced path as JSON requests, just unparsed
+        return await self._request(path="/api/v1/badge.svg", params=params, raw=True)
 
     # Management
     async def manage_health(
@@ -280,7 +437,7 @@ class NetdataClient:
     # Charts (v1 - legacy)
     async def get_charts(self) -> dict[str, Any]:
         """Get summary of all charts (v1 API - legacy)."""
-        return await self._request("charts")
+        return await self._cached_request("charts", ttl=30.0)
 
     async def get_chart(self, chart: str) -> dict[str, Any]:
         """
@@ -295,296 +452,419 @@ class NetdataClient:
 # Initialize MCP server
 app = Server("netdata-mcp-server")
 netdata_client: Optional[NetdataClient] = None
-
-
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Netdata tools."""
-    return [
-        Tool(
-            name="netdata_get_info",
-            description="Get basic information about the Netdata agent including version, OS, collectors, and alarm counts",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+_client_lock = asyncio.Lock()
+
+
+# Schema fragments shared by several tools, interned once instead of
+# duplicated per Tool definition
+_EMPTY_OBJ_SCHEMA = {
+    "type": "object",
+    "properties": {},
+}
+_API_VERSION_V2V3 = {
+    "type": "string",
+    "description": "API version to use (v2 or v3)",
+    "enum": ["v2", "v3"],
+    "default": "v2",
+}
+_SCOPE_NODES_PROP = {
+    "type": "string",
+    "description": "Simple pattern to filter nodes",
+    "default": "*",
+}
+_CHART_ID_PROP = {
+    "type": "string",
+    "description": "Chart ID",
+}
+
+# Tool schemas are static; built once at import time so the list_tools
+# handler returns the same list instead of re-allocating it per RPC.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="netdata_get_info",
+        description="Get basic information about the Netdata agent including version, OS, collectors, and alarm counts",
+        inputSchema=_EMPTY_OBJ_SCHEMA,
+    ),
+    Tool(
+        name="netdata_get_nodes",
+        description="Get list of all nodes hosted by this Netdata Agent with their status and information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "api_version": {
+                    "type": "string",
+                    "description": "API version to use (v2 or v3)",
+                    "enum": ["v2", "v3"],
+                    "default": "v2",
+                }
             },
-        ),
-        Tool(
-            name="netdata_get_nodes",
-            description="Get list of all nodes hosted by this Netdata Agent with their status and information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "api_version": {
-                        "type": "string",
-                        "description": "API version to use (v2 or v3)",
-                        "enum": ["v2", "v3"],
-                        "default": "v2",
-                    }
+        },
+    ),
+    Tool(
+        name="netdata_get_contexts",
+        description="Get list of all metric contexts across all nodes with their metadata",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "api_version": _API_VERSION_V2V3,
+                "scope_nodes": _SCOPE_NODES_PROP,
+                "scope_contexts": {
+                    "type": "string",
+                    "description": "Simple pattern to filter contexts",
+                    "default": "*",
                 },
             },
-        ),
-        Tool(
-            name="netdata_get_contexts",
-            description="Get list of all metric contexts across all nodes with their metadata",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "api_version": {
-                        "type": "string",
-                        "description": "API version to use (v2 or v3)",
-                        "enum": ["v2", "v3"],
-                        "default": "v2",
-                    },
-                    "scope_nodes": {
-                        "type": "string",
-                        "description": "Simple pattern to filter nodes",
-                        "default": "*",
-                    },
-                    "scope_contexts": {
-                        "type": "string",
-                        "description": "Simple pattern to filter contexts",
-                        "default": "*",
-                    },
+        },
+    ),
+    Tool(
+        name="netdata_search_contexts",
+        description="Search for contexts matching a query string across all nodes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query string",
                 },
+                "api_version": _API_VERSION_V2V3,
+                "scope_nodes": _SCOPE_NODES_PROP,
             },
-        ),
-        Tool(
-            name="netdata_search_contexts",
-            description="Search for contexts matching a query string across all nodes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query string",
-                    },
-                    "api_version": {
-                        "type": "string",
-                        "description": "API version to use (v2 or v3)",
-                        "enum": ["v2", "v3"],
-                        "default": "v2",
-                    },
-                    "scope_nodes": {
-                        "type": "string",
-                        "description": "Simple pattern to filter nodes",
-                        "default": "*",
-                    },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="netdata_get_data",
+        description="Query metric data for a chart or context with time-series data for all dimensions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "chart": {
+                    "type": "string",
+                    "description": "Chart ID to query (v1 API only)",
                 },
-                "required": ["query"],
-            },
-        ),
-        Tool(
-            name="netdata_get_data",
-            description="Query metric data for a chart or context with time-series data for all dimensions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "chart": {
-                        "type": "string",
-                        "description": "Chart ID to query (v1 API only)",
-                    },
-                    "context": {
-                        "type": "string",
-                        "description": "Context to query (e.g., 'system.cpu', 'disk.io')",
-                    },
-                    "after": {
-                        "type": "integer",
-                        "description": "Start time in seconds (negative for relative to now, positive for unix timestamp)",
-                        "default": -600,
-                    },
-                    "before": {
-                        "type": "integer",
-                        "description": "End time in seconds (0 for now, negative for relative, positive for unix timestamp)",
-                        "default": 0,
-                    },
-                    "points": {
-                        "type": "integer",
-                        "description": "Number of points to return (0 for all available)",
-                        "default": 0,
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Response format",
-                        "enum": ["json", "json2", "csv", "datatable", "jsonp"],
-                        "default": "json",
-                    },
-                    "group": {
-                        "type": "string",
-                        "description": "Time aggregation function",
-                        "enum": [
-                            "min",
-                            "max",
-                            "avg",
-                            "average",
-                            "median",
-                            "sum",
-                            "stddev",
-                        ],
-                        "default": "average",
-                    },
-                    "options": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Additional options (jsonwrap, raw, minify, etc.)",
-                    },
-                    "api_version": {
-                        "type": "string",
-                        "description": "API version to use (v1, v2, or v3)",
-                        "enum": ["v1", "v2", "v3"],
-                        "default": "v1",
-                    },
+                "context": {
+                    "type": "string",
+                    "description": "Context to query (e.g., 'system.cpu', 'disk.io')",
                 },
-            },
-        ),
-        Tool(
-            name="netdata_get_all_metrics",
-            description="Get latest values for all metrics across all charts",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "format": {
-                        "type": "string",
-                        "description": "Response format",
-                        "enum": ["shell", "prometheus", "json"],
-                        "default": "json",
-                    },
-                    "filter": {
-                        "type": "string",
-                        "description": "Filter pattern to apply to charts",
-                    },
+                "after": {
+                    "type": "integer",
+                    "description": "Start time in seconds (negative for relative to now, positive for unix timestamp)",
+                    "default": -600,
+                },
+                "before": {
+                    "type": "integer",
+                    "description": "End time in seconds (0 for now, negative for relative, positive for unix timestamp)",
+                    "default": 0,
+                },
+                "points": {
+                    "type": "integer",
+                    "description": "Number of points to return (0 for all available)",
+                    "default": 0,
+                },
+                "format": {
+                    "type": "string",
+                    "description": "Response format",
+                    "enum": ["json", "json2", "csv", "datatable", "jsonp"],
+                    "default": "json",
+                },
+                "group": {
+                    "type": "string",
+                    "description": "Time aggregation function",
+                    "enum": [
+                        "min",
+                        "max",
+                        "avg",
+                        "average",
+                        "median",
+                        "sum",
+                        "stddev",
+                    ],
+                    "default": "average",
+                },
+                "options": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Additional options (jsonwrap, raw, minify, etc.)",
+                },
+                "api_version": {
+                    "type": "string",
+                    "description": "API version to use (v1, v2, or v3)",
+                    "enum": ["v1", "v2", "v3"],
+                    "default": "v1",
                 },
             },
-        ),
-        Tool(
-            name="netdata_get_alerts",
-            description="Get list of active or raised alarms with their current state",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "all": {
-                        "type": "boolean",
-                        "description": "Return all enabled alarms",
-                        "default": False,
-                    },
-                    "active": {
-                        "type": "boolean",
-                        "description": "Return raised alarms in WARNING or CRITICAL state",
-                        "default": False,
-                    },
+        },
+    ),
+    Tool(
+        name="netdata_get_all_metrics",
+        description="Get latest values for all metrics across all charts",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "format": {
+                    "type": "string",
+                    "description": "Response format",
+                    "enum": ["shell", "prometheus", "json"],
+                    "default": "json",
+                },
+                "filter": {
+                    "type": "string",
+                    "description": "Filter pattern to apply to charts",
                 },
             },
-        ),
-        Tool(
-            name="netdata_get_alert_log",
-            description="Get alarm log entries with historical information on raised and cleared alarms",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "after": {
-                        "type": "integer",
-                        "description": "Return events after this UNIQUEID",
-                    }
+        },
+    ),
+    Tool(
+        name="netdata_get_all_metrics_batch",
+        description="Get latest values for several chart filter patterns in a single request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filters": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Chart filter patterns, combined into one query",
+                },
+                "format": {
+                    "type": "string",
+                    "description": "Response format",
+                    "enum": ["shell", "prometheus", "json"],
+                    "default": "json",
                 },
             },
-        ),
-        Tool(
-            name="netdata_get_alert_variables",
-            description="Get variables available for configuring alarms for a specific chart",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "chart": {
-                        "type": "string",
-                        "description": "Chart ID",
-                    }
+            "required": ["filters"],
+        },
+    ),
+    Tool(
+        name="netdata_get_alerts",
+        description="Get list of active or raised alarms with their current state",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "all": {
+                    "type": "boolean",
+                    "description": "Return all enabled alarms",
+                    "default": False,
+                },
+                "active": {
+                    "type": "boolean",
+                    "description": "Return raised alarms in WARNING or CRITICAL state",
+                    "default": False,
                 },
-                "required": ["chart"],
             },
-        ),
-        Tool(
-            name="netdata_get_functions",
-            description="Get list of all registered collector functions that can be executed on demand",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+        },
+    ),
+    Tool(
+        name="netdata_get_alert_log",
+        description="Get alarm log entries with historical information on raised and cleared alarms",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "after": {
+                    "type": "integer",
+                    "description": "Return events after this UNIQUEID",
+                }
             },
-        ),
-        Tool(
-            name="netdata_execute_function",
-            description="Execute a collector function on demand",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "function": {
-                        "type": "string",
-                        "description": "Name of the function to execute",
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Timeout in seconds",
-                        "default": 10,
-                    },
+        },
+    ),
+    Tool(
+        name="netdata_get_alert_variables",
+        description="Get variables available for configuring alarms for a specific chart",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "chart": _CHART_ID_PROP,
+            },
+            "required": ["chart"],
+        },
+    ),
+    Tool(
+        name="netdata_get_functions",
+        description="Get list of all registered collector functions that can be executed on demand",
+        inputSchema=_EMPTY_OBJ_SCHEMA,
+    ),
+    Tool(
+        name="netdata_execute_function",
+        description="Execute a collector function on demand",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "function": {
+                    "type": "string",
+                    "description": "Name of the function to execute",
+                },
+                "timeout": {
+                    "type": "integer",
+                    "description": "Timeout in seconds",
+                    "default": 10,
                 },
-                "required": ["function"],
             },
-        ),
-        Tool(
-            name="netdata_manage_health",
-            description="Manage health checks and notifications at runtime (disable, silence, reset)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "cmd": {
-                        "type": "string",
-                        "description": "Command to execute",
-                        "enum": [
-                            "DISABLE ALL",
-                            "SILENCE ALL",
-                            "DISABLE",
-                            "SILENCE",
-                            "RESET",
-                            "LIST",
-                        ],
-                    },
-                    "alarm": {
-                        "type": "string",
-                        "description": "Alarm name pattern",
-                    },
-                    "chart": {
-                        "type": "string",
-                        "description": "Chart ID pattern",
-                    },
-                    "context": {
-                        "type": "string",
-                        "description": "Context pattern",
-                    },
+            "required": ["function"],
+        },
+    ),
+    Tool(
+        name="netdata_manage_health",
+        description="Manage health checks and notifications at runtime (disable, silence, reset)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "cmd": {
+                    "type": "string",
+                    "description": "Command to execute",
+                    "enum": [
+                        "DISABLE ALL",
+                        "SILENCE ALL",
+                        "DISABLE",
+                        "SILENCE",
+                        "RESET",
+                        "LIST",
+                    ],
+                },
+                "alarm": {
+                    "type": "string",
+                    "description": "Alarm name pattern",
+                },
+                "chart": {
+                    "type": "string",
+                    "description": "Chart ID pattern",
+                },
+                "context": {
+                    "type": "string",
+                    "description": "Context pattern",
                 },
             },
-        ),
-        Tool(
-            name="netdata_get_charts",
-            description="Get summary of all charts (legacy v1 API)",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+        },
+    ),
+    Tool(
+        name="netdata_get_charts",
+        description="Get summary of all charts (legacy v1 API)",
+        inputSchema=_EMPTY_OBJ_SCHEMA,
+    ),
+    Tool(
+        name="netdata_get_chart",
+        description="Get detailed information about a specific chart (legacy v1 API)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "chart": _CHART_ID_PROP,
             },
-        ),
-        Tool(
-            name="netdata_get_chart",
-            description="Get detailed information about a specific chart (legacy v1 API)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "chart": {
-                        "type": "string",
-                        "description": "Chart ID",
-                    }
-                },
-                "required": ["chart"],
+            "required": ["chart"],
+        },
+    ),
+    Tool(
+        name="netdata_multi",
+        description="Run several Netdata tool calls concurrently and return their results as a list",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run in parallel",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Tool name to invoke",
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool",
+                            },
+                        },
+                        "required": ["name"],
+                    },
+                }
             },
-        ),
-    ]
+            "required": ["calls"],
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Netdata tools."""
+    return _TOOLS
+
+
+# O(1) tool dispatch: maps tool name to a callable returning the client
+# coroutine for that call, replacing a fourteen-branch if/elif walk.
+_DISPATCH = {
+    "netdata_get_info": lambda c, a: c.get_info(),
+    "netdata_get_nodes": lambda c, a: c.get_nodes(api_version=a.get("api_version", "v2")),
+    "netdata_get_contexts": lambda c, a: c.get_contexts(
+        api_version=a.get("api_version", "v2"),
+        scope_nodes=a.get("scope_nodes", "*"),
+        scope_contexts=a.get("scope_contexts", "*"),
+    ),
+    "netdata_search_contexts": lambda c, a: c.search_contexts(
+        query=a["query"],
+        api_version=a.get("api_version", "v2"),
+        scope_nodes=a.get("scope_nodes", "*"),
+    ),
+    "netdata_get_data": lambda c, a: c.get_data(
+        chart=a.get("chart"),
+        context=a.get("context"),
+        after=a.get("after", -600),
+        before=a.get("before", 0),
+        points=a.get("points", 0),
+        format=a.get("format", "json"),
+        group=a.get("group", "average"),
+        options=a.get("options"),
+        api_version=a.get("api_version", "v1"),
+    ),
+    "netdata_get_all_metrics": lambda c, a: c.get_all_metrics(
+        format=a.get("format", "json"),
+        filter=a.get("filter"),
+    ),
+    "netdata_get_all_metrics_batch": lambda c, a: c.get_all_metrics_batch(
+        filters=a["filters"],
+        format=a.get("format", "json"),
+    ),
+    "netdata_get_alerts": lambda c, a: c.get_alerts(
+        all=a.get("all", False),
+        active=a.get("active", False),
+    ),
+    "netdata_get_alert_log": lambda c, a: c.get_alert_log(after=a.get("after")),
+    "netdata_get_alert_variables": lambda c, a: c.get_alert_variables(chart=a["chart"]),
+    "netdata_get_functions": lambda c, a: c.get_functions(),
+    "netdata_execute_function": lambda c, a: c.execute_function(
+        function=a["function"],
+        timeout=a.get("timeout", 10),
+    ),
+    "netdata_manage_health": lambda c, a: c.manage_health(
+        cmd=a.get("cmd"),
+        alarm=a.get("alarm"),
+        chart=a.get("chart"),
+        context=a.get("context"),
+    ),
+    "netdata_get_charts": lambda c, a: c.get_charts(),
+    "netdata_get_chart": lambda c, a: c.get_chart(chart=a["chart"]),
+    "netdata_multi": lambda c, a: _run_multi(a),
+}
+
+
+async def _execute(name: str, arguments: Any) -> Any:
+    """Execute one tool call and return its raw (unserialized) result."""
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        return {"error": f"Unknown tool: {name}"}
+    return await handler(netdata_client, arguments)
+
+
+async def _run_multi(arguments: Any) -> list[Any]:
+    """Run a batch of tool calls concurrently and collect their results.
+
+    The pooled HTTP/2 connections let the upstream queries proceed in
+    parallel, so a batch costs roughly one round-trip instead of N.
+    """
+    calls = arguments.get("calls", [])
+    results = await asyncio.gather(
+        *(_execute(c.get("name", ""), c.get("arguments", {})) for c in calls),
+        return_exceptions=True,
+    )
+    return [{"error": str(r)} if isinstance(r, BaseException) else r for r in results]
 
 
 @app.call_tool()
@@ -593,101 +873,34 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     global netdata_client
 
     if netdata_client is None:
-        # Initialize with default localhost URL
-        # Users can set NETDATA_URL and NETDATA_API_KEY environment variables
-        import os
-
-        base_url = os.getenv("NETDATA_URL", "http://localhost:19999")
-        api_key = os.getenv("NETDATA_API_KEY")
-        netdata_client = NetdataClient(base_url=base_url, api_key=api_key)
+        # Double-checked init under a lock: simultaneous first calls must
+        # not each construct a client (and leak a connection pool)
+        async with _client_lock:
+            if netdata_client is None:
+                # Initialize with default localhost URL
+                # Users can set NETDATA_URL and NETDATA_API_KEY environment variables
+                import os
+
+                base_url = os.getenv("NETDATA_URL", "http://localhost:19999")
+                api_key = os.getenv("NETDATA_API_KEY")
+                netdata_client = NetdataClient(base_url=base_url, api_key=api_key)
+
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
     try:
-        result = None
-
-        if name == "netdata_get_info":
-            result = await netdata_client.get_info()
-
-        elif name == "netdata_get_nodes":
-            api_version = arguments.get("api_version", "v2")
-            result = await netdata_client.get_nodes(api_version=api_version)
-
-        elif name == "netdata_get_contexts":
-            api_version = arguments.get("api_version", "v2")
-            scope_nodes = arguments.get("scope_nodes", "*")
-            scope_contexts = arguments.get("scope_contexts", "*")
-            result = await netdata_client.get_contexts(
-                api_version=api_version,
-                scope_nodes=scope_nodes,
-                scope_contexts=scope_contexts,
-            )
-
-        elif name == "netdata_search_contexts":
-            query = arguments["query"]
-            api_version = arguments.get("api_version", "v2")
-            scope_nodes = arguments.get("scope_nodes", "*")
-            result = await netdata_client.search_contexts(
-                query=query, api_version=api_version, scope_nodes=scope_nodes
-            )
-
-        elif name == "netdata_get_data":
-            result = await netdata_client.get_data(
-                chart=arguments.get("chart"),
-                context=arguments.get("context"),
-                after=arguments.get("after", -600),
-                before=arguments.get("before", 0),
-                points=arguments.get("points", 0),
-                format=arguments.get("format", "json"),
-                group=arguments.get("group", "average"),
-                options=arguments.get("options"),
-                api_version=arguments.get("api_version", "v1"),
-            )
-
-        elif name == "netdata_get_all_metrics":
-            result = await netdata_client.get_all_metrics(
-                format=arguments.get("format", "json"),
-                filter=arguments.get("filter"),
-            )
-
-        elif name == "netdata_get_alerts":
-            result = await netdata_client.get_alerts(
-                all=arguments.get("all", False),
-                active=arguments.get("active", False),
-            )
-
-        elif name == "netdata_get_alert_log":
-            result = await netdata_client.get_alert_log(after=arguments.get("after"))
-
-        elif name == "netdata_get_alert_variables":
-            result = await netdata_client.get_alert_variables(chart=arguments["chart"])
-
-        elif name == "netdata_get_functions":
-            result = await netdata_client.get_functions()
-
-        elif name == "netdata_execute_function":
-            result = await netdata_client.execute_function(
-                function=arguments["function"],
-                timeout=arguments.get("timeout", 10),
-            )
-
-        elif name == "netdata_manage_health":
-            result = await netdata_client.manage_health(
-                cmd=arguments.get("cmd"),
-                alarm=arguments.get("alarm"),
-                chart=arguments.get("chart"),
-                context=arguments.get("context"),
-            )
-
-        elif name == "netdata_get_charts":
-            result = await netdata_client.get_charts()
-
-        elif name == "netdata_get_chart":
-            result = await netdata_client.get_chart(chart=arguments["chart"])
-
+        result = await handler(netdata_client, arguments)
+
+        # Format the result as JSON. Pretty-print small results for
+        # readability, but serve large payloads compact: indentation
+        # whitespace inflates big data responses (and the LLM tokens
+        # spent on them) by roughly 40%.
+        compact = orjson.dumps(result)
+        if len(compact) > 64_000:
+            result_text = compact.decode("utf-8")
         else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
-        # Format the result as JSON
-        result_text = json.dumps(result, indent=2)
+            result_text = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode("utf-8")
         return [TextContent(type="text", text=result_text)]
 
     except Exception as e:
@@ -698,13 +911,26 @@ async def main():
     """Run the MCP server."""
     from mcp.server.stdio import stdio_server
 
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+    finally:
+        # Drain the keep-alive pool cleanly on shutdown or cancellation
+        # instead of leaking open connections at process exit
+        if netdata_client is not None:
+            await netdata_client.close()
 
 
 if __name__ == "__main__":
+    try:
+        # C-accelerated event loop; the stdlib selector loop is the fallback
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -1,15 +1,36 @@
 """Tests for Netdata MCP Server."""
 
+import json
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from netdata_mcp import NetdataClient
 
 
+def make_response(payload, status_code=200):
+    """Build a mock httpx streaming response carrying a serialized JSON body."""
+    body = json.dumps(payload).encode("utf-8")
+    response = MagicMock()
+    response.status_code = status_code
+
+    async def aiter_bytes():
+        yield body
+
+    response.aiter_bytes = aiter_bytes
+
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=response)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return ctx
+
+
 @pytest.fixture
 def mock_httpx_client():
     """Mock httpx AsyncClient."""
     with patch("netdata_mcp.server.httpx.AsyncClient") as mock:
         client_instance = AsyncMock()
+        # client.stream() is a sync call returning an async context manager
+        client_instance.stream = MagicMock()
         mock.return_value = client_instance
         yield client_instance
 
@@ -26,12 +47,9 @@ async def test_netdata_client_init():
 @pytest.mark.asyncio
 async def test_get_info(mock_httpx_client):
     """Test get_info method."""
-    mock_response = AsyncMock()
-    mock_response.json.return_value = {
-        "version": "1.0.0",
-        "hostname": "test-host",
-    }
-    mock_httpx_client.get.return_value = mock_response
+    mock_httpx_client.stream.return_value = make_response(
+        {"version": "1.0.0", "hostname": "test-host"}
+    )
 
     client = NetdataClient()
     result = await client.get_info()
@@ -44,12 +62,9 @@ async def test_get_info(mock_httpx_client):
 @pytest.mark.asyncio
 async def test_get_data_with_context(mock_httpx_client):
     """Test get_data with context parameter."""
-    mock_response = AsyncMock()
-    mock_response.json.return_value = {
-        "labels": ["time", "cpu"],
-        "data": [[1234567890, 50.5]],
-    }
-    mock_httpx_client.get.return_value = mock_response
+    mock_httpx_client.stream.return_value = make_response(
+        {"labels": ["time", "cpu"], "data": [[1234567890, 50.5]]}
+    )
 
     client = NetdataClient()
     result = await client.get_data(
@@ -63,14 +78,12 @@ async def test_get_data_with_context(mock_httpx_client):
 @pytest.mark.asyncio
 async def test_get_alerts(mock_httpx_client):
     """Test get_alerts method."""
-    mock_response = AsyncMock()
-    mock_response.json.return_value = {
-        "hostname": "test-host",
-        "alarms": {
-            "test_alarm": {"status": "WARNING", "value": 75.0}
-        },
-    }
-    mock_httpx_client.get.return_value = mock_response
+    mock_httpx_client.stream.return_value = make_response(
+        {
+            "hostname": "test-host",
+            "alarms": {"test_alarm": {"status": "WARNING", "value": 75.0}},
+        }
+    )
 
     client = NetdataClient()
     result = await client.get_alerts(active=True)
@@ -83,14 +96,14 @@ async def test_get_alerts(mock_httpx_client):
 @pytest.mark.asyncio
 async def test_search_contexts(mock_httpx_client):
     """Test search_contexts method."""
-    mock_response = AsyncMock()
-    mock_response.json.return_value = {
-        "contexts": {
-            "disk.io": {"family": "disk", "priority": 1000},
-            "disk.ops": {"family": "disk", "priority": 1010},
+    mock_httpx_client.stream.return_value = make_response(
+        {
+            "contexts": {
+                "disk.io": {"family": "disk", "priority": 1000},
+                "disk.ops": {"family": "disk", "priority": 1010},
+            }
         }
-    }
-    mock_httpx_client.get.return_value = mock_response
+    )
 
     client = NetdataClient()
     result = await client.search_contexts(query="disk", api_version="v2")
@@ -100,12 +113,40 @@ async def test_search_contexts(mock_httpx_client):
     await client.close()
 
 
+@pytest.mark.asyncio
+async def test_get_all_metrics_batch(mock_httpx_client):
+    """Test that batched filters collapse into one pipe-separated request."""
+    mock_httpx_client.stream.return_value = make_response({"system.cpu": {}})
+
+    client = NetdataClient()
+    await client.get_all_metrics_batch(filters=["system.cpu", "system.ram"])
+
+    assert mock_httpx_client.stream.call_count == 1
+    params = mock_httpx_client.stream.call_args.kwargs["params"]
+    assert params["filter"] == "system.cpu|system.ram"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_metadata_ttl_cache(mock_httpx_client):
+    """Test that repeated metadata calls are served from the TTL cache."""
+    mock_httpx_client.stream.return_value = make_response({"version": "1.0.0"})
+
+    client = NetdataClient()
+    first = await client.get_info()
+    second = await client.get_info()
+
+    assert first == second
+    assert mock_httpx_client.stream.call_count == 1
+    await client.close()
+
+
 @pytest.mark.asyncio
 async def test_error_handling(mock_httpx_client):
     """Test error handling in client."""
     import httpx
 
-    mock_httpx_client.get.side_effect = httpx.HTTPError("Connection failed")
+    mock_httpx_client.stream.side_effect = httpx.HTTPError("Connection failed")
 
     client = NetdataClient()
     result = await client.get_info()